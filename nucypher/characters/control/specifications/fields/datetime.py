@@ -15,6 +15,8 @@
  along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+from datetime import datetime
+
 import maya
 from marshmallow import fields
 
@@ -28,6 +30,14 @@ class DateTime(BaseField, fields.Field):
         return value.iso8601()
 
     def _deserialize(self, value, attr, data, **kwargs):
+        try:
+            # Fast path for the common case of well-formed ISO-8601 timestamps (e.g. as produced by `_serialize`)
+            parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except (AttributeError, ValueError):
+            pass  # let maya handle (or reject) anything more exotic
+        else:
+            return maya.MayaDT.from_datetime(parsed)  # naive timestamps are taken as UTC, as from_iso8601 does
+
         try:
             return maya.MayaDT.from_iso8601(iso8601_string=value)
         except maya.pendulum.parsing.ParserError as e:
@@ -30,6 +30,7 @@ from cryptography import x509
 from cryptography.hazmat.backends import default_backend
 from cryptography.x509 import Certificate
 from nucypher_core import MetadataRequest, FleetStateChecksum, NodeMetadata
+from requests.adapters import HTTPAdapter
 from requests.exceptions import SSLError
 
 from nucypher.blockchain.eth.registry import BaseContractRegistry
@@ -42,8 +43,9 @@ EXEMPT_FROM_VERIFICATION.bool_value(False)
 
 
 class NucypherMiddlewareClient:
-    library = requests
     timeout = 1.2
+    pool_connections = 32  # number of per-host connection pools cached by the session (i.e. distinct nodes)
+    pool_maxsize = 32  # connections kept alive per host, i.e. threads sharing this client that can talk to one node at once
 
     def __init__(self,
                  registry: Optional['BaseContractRegistry'] = None,
@@ -54,6 +56,22 @@ class NucypherMiddlewareClient:
         self.registry = registry
         self.eth_provider_uri = eth_provider_uri
         self.storage = storage or ForgetfulNodeStorage()  # for certificate storage
+        self.library = self._make_session()
+
+    @classmethod
+    def _make_session(cls) -> requests.Session:
+        """
+        A single session per client lets repeated requests to the same node
+        reuse a pooled connection instead of a fresh TCP and TLS handshake.
+
+        The session is shared by every thread using this client (e.g. WorkerPool workers,
+        the learning loop and Porter) rather than one connection per request; connection pools
+        are thread-safe and the session keeps no per-request state that nodes rely on.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=cls.pool_connections, pool_maxsize=cls.pool_maxsize, max_retries=0)
+        session.mount('https://', adapter)
+        return session
 
     def get_certificate(self,
                         host,
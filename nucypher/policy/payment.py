@@ -212,9 +212,10 @@ class SubscriptionManagerPayment(ContractPayment):
             if expiration and commencement:
                 duration = expiration - commencement
 
+        fee_rate = self.rate  # single contract read
         q = self.Quote(
-            rate=Wei(self.rate),
-            value=Wei(self.rate * duration * shares),
+            rate=Wei(fee_rate),
+            value=Wei(fee_rate * duration * shares),
             shares=shares,
             commencement=Timestamp(commencement),
             expiration=Timestamp(expiration),
@@ -83,11 +83,13 @@ class Policy(ABC):
         self.nodes = None  # set by publication
 
         self.publisher = publisher
+        self.payment_method = payment_method
+        self.payment_method.validate_price(shares=self.shares, value=value, duration=duration)
+
+        # Only derived once the price is known to be valid
         self.hrac = HRAC(publisher_verifying_key=self.publisher.stamp.as_umbral_pubkey(),
                          bob_verifying_key=self.bob.stamp.as_umbral_pubkey(),
                          label=self.label)
-        self.payment_method = payment_method
-        self.payment_method.validate_price(shares=self.shares, value=value, duration=duration)
 
     def __repr__(self):
         return f"{self.__class__.__name__}:{bytes(self.hrac).hex()[:6]}"
@@ -124,7 +126,7 @@ class Policy(ABC):
         """Send concurrent requests to the /ping HTTP endpoint of nodes drawn from the reservoir."""
 
         ursulas = ursulas or []
-        handpicked_addresses = [ChecksumAddress(ursula.checksum_address) for ursula in ursulas]
+        handpicked_addresses = [ursula.checksum_address for ursula in ursulas]
 
         self.publisher.block_until_number_of_known_nodes_is(self.shares, learn_on_this_thread=True, eager=True)
         reservoir = self._make_reservoir(handpicked_addresses)
@@ -175,17 +177,19 @@ class Policy(ABC):
             for ursula, vkfrag in zip(ursulas, self.kfrags)
         }
 
-        treasure_map = TreasureMap(signer=self.publisher.stamp.as_umbral_signer(),
+        publisher_stamp = self.publisher.stamp
+        publisher_signer = publisher_stamp.as_umbral_signer()
+        treasure_map = TreasureMap(signer=publisher_signer,
                                    hrac=self.hrac,
                                    policy_encrypting_key=self.public_key,
                                    assigned_kfrags=assigned_kfrags,
                                    threshold=self.threshold)
 
-        enc_treasure_map = treasure_map.encrypt(signer=self.publisher.stamp.as_umbral_signer(),
+        enc_treasure_map = treasure_map.encrypt(signer=publisher_signer,
                                                 recipient_key=self.bob.public_keys(DecryptingPower))
 
         # TODO: Signal revocation without using encrypted kfrag
-        revocation_kit = RevocationKit(treasure_map=treasure_map, signer=self.publisher.stamp)
+        revocation_kit = RevocationKit(treasure_map=treasure_map, signer=publisher_stamp)
 
         enacted_policy = EnactedPolicy(self.hrac,
                                        self.label,
@@ -193,7 +197,7 @@ class Policy(ABC):
                                        treasure_map.threshold,
                                        enc_treasure_map,
                                        revocation_kit,
-                                       self.publisher.stamp.as_umbral_pubkey())
+                                       publisher_stamp.as_umbral_pubkey())
 
         return enacted_policy
 
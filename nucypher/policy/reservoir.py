@@ -74,12 +74,20 @@ class MergedReservoir:
         self.reservoir = reservoir
 
     def __call__(self) -> Optional[ChecksumAddress]:
-        if self.values:
-            return self.values.pop(0)
-        elif len(self.reservoir) > 0:
-            return self.reservoir.draw(1)[0]
-        else:
-            return None
+        batch = self.draw_at_most(1)
+        return batch[0] if batch else None
+
+    def draw_at_most(self, quantity: int) -> List[ChecksumAddress]:
+        """
+        Draws up to `quantity` values in a single batch, taking them from the list first.
+        Returns fewer values (possibly none) if both sources are exhausted.
+        """
+        if quantity <= 0:
+            return []
+        batch, self.values = self.values[:quantity], self.values[quantity:]
+        if len(batch) < quantity:
+            batch.extend(self.reservoir.draw_at_most(quantity - len(batch)))
+        return batch
 
 
 class PrefetchStrategy:
@@ -94,12 +102,7 @@ class PrefetchStrategy:
         self.need_successes = need_successes
 
     def __call__(self, successes: int) -> Optional[List[ChecksumAddress]]:
-        batch = []
-        for i in range(self.need_successes - successes):
-            value = self.reservoir()
-            if value is None:
-                break
-            batch.append(value)
+        batch = self.reservoir.draw_at_most(self.need_successes - successes)
         if not batch:
             return None
         return batch
@@ -18,16 +18,18 @@
 
 import random
 from ipaddress import ip_address
-from typing import Union, Optional
+from typing import List, Optional, Union
 
 import requests
-from requests.exceptions import RequestException, HTTPError
+from requests.exceptions import RequestException
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
 
 from nucypher.acumen.perception import FleetSensor
 from nucypher.blockchain.eth.registry import BaseContractRegistry
 from nucypher.config.storages import LocalFileBasedNodeStorage
 from nucypher.network.exceptions import NodeSeemsToBeDown
 from nucypher.network.middleware import RestMiddleware, NucypherMiddlewareClient
+from nucypher.utilities.concurrency import WorkerPool
 from nucypher.utilities.logging import Logger
 
 
@@ -43,12 +45,13 @@ CENTRALIZED_IP_ORACLE_URL = 'https://ifconfig.me/'
 
 LOOPBACK_ADDRESS = '127.0.0.1'
 
+MAX_IP_RESPONSE_LENGTH = 64  # bytes, enough for any textual IPv4/IPv6 address plus whitespace
+
 RequestErrors = (
     # https://requests.readthedocs.io/en/latest/user/quickstart/#errors-and-exceptions
-    ConnectionError,
-    TimeoutError,
+    # RequestException is the base of requests' own ConnectionError, Timeout, HTTPError, SSLError, etc.
     RequestException,
-    HTTPError
+    TimeoutError
 )
 
 RESERVED_IP_ADDRESSES = (
@@ -59,6 +62,9 @@ RESERVED_IP_ADDRESSES = (
 
 IP_DETECTION_LOGGER = Logger('external-ip-detection')
 
+# Default teachers which successfully reported an external IP, keyed by (teacher URI, federated mode)
+_DEFAULT_TEACHER_CACHE = dict()
+
 
 def validate_operator_ip(ip: str) -> None:
     if ip in RESERVED_IP_ADDRESSES:
@@ -67,19 +73,30 @@ def validate_operator_ip(ip: str) -> None:
                                 f"external IPV4 address")
 
 
-def _request(url: str, certificate=None) -> Union[str, None]:
+def _request(url: str, certificate=None, timeout: float = 3) -> Union[str, None]:
     """
-    Utility function to send a GET request to a URL returning it's
-    text content or None, suppressing all errors. Certificate is
+    Utility function to send a GET request to a URL returning the IP address
+    in it's text content or None, suppressing all errors. Certificate is
     needed if the remote URL source is self-signed.
     """
     try:
         # 'None' or 'True' will verify self-signed certificates
-        response = requests.get(url, verify=certificate)
+        response = requests.get(url, verify=certificate, stream=True, timeout=timeout)
     except RequestErrors:
         return None
-    if response.status_code == 200:
-        return response.text
+    with response:
+        if response.status_code != 200:
+            return None
+        try:
+            # An IP address is short; don't download anything beyond it
+            content = response.raw.read(MAX_IP_RESPONSE_LENGTH, decode_content=True)
+        except (*RequestErrors, Urllib3HTTPError):
+            return None
+    try:
+        return str(ip_address(content.decode('ascii', errors='ignore').strip()))
+    except ValueError:
+        IP_DETECTION_LOGGER.debug(f'{url} returned an invalid IP response; Got {content!r}')
+        return None
 
 
 def _request_from_node(teacher,
@@ -87,7 +104,8 @@ def _request_from_node(teacher,
                        timeout: int = 2,
                        log: Logger = IP_DETECTION_LOGGER
                        ) -> Union[str, None]:
-    if not client:
+    one_shot_client = not client
+    if one_shot_client:
         client = NucypherMiddlewareClient()
     try:
         response = client.get(node_or_sprout=teacher, path=f"ping", timeout=timeout)  # TLS certificate logic within
@@ -97,6 +115,9 @@ def _request_from_node(teacher,
     except NodeSeemsToBeDown:
         # This node is unreachable.  Move on.
         return
+    finally:
+        if one_shot_client:
+            client.library.close()  # nothing else will reuse its connections
     if response.status_code == 200:
         try:
             ip = str(ip_address(response.text))
@@ -137,19 +158,30 @@ def get_external_ip_from_default_teacher(network: str,
     #####
 
     external_ip = None
-    for teacher_uri in TEACHER_NODES[network]:
-        try:
-            teacher = Ursula.from_teacher_uri(teacher_uri=teacher_uri,
-                                              federated_only=federated_only,
-                                              min_stake=0)  # TODO: Handle customized min stake here.
-            # TODO: Pass registry here to verify stake (not essential here since it's a hardcoded node)
-            external_ip = _request_from_node(teacher=teacher)
+    client = NucypherMiddlewareClient()
+    with client.library:
+        for teacher_uri in TEACHER_NODES[network]:
+            cache_key = (teacher_uri, federated_only)
+            try:
+                teacher = _DEFAULT_TEACHER_CACHE.get(cache_key)
+                if teacher is None:
+                    teacher = Ursula.from_teacher_uri(teacher_uri=teacher_uri,
+                                                      federated_only=federated_only,
+                                                      min_stake=0)  # TODO: Handle customized min stake here.
+                # TODO: Pass registry here to verify stake (not essential here since it's a hardcoded node)
+                external_ip = _request_from_node(teacher=teacher, client=client)
+            except NodeSeemsToBeDown:
+                # Teacher is unreachable, try next one
+                pass
+            finally:
+                # Only teachers that replied with an IP address are reused; errors evict them too
+                if external_ip:
+                    _DEFAULT_TEACHER_CACHE[cache_key] = teacher
+                else:
+                    _DEFAULT_TEACHER_CACHE.pop(cache_key, None)
             # Found a reachable teacher, return from loop
             if external_ip:
                 break
-        except NodeSeemsToBeDown:
-            # Teacher is unreachable, try next one
-            continue
 
     if not external_ip:
         log.debug(f'{base_error}: No teacher available for network "{network}".')
@@ -160,22 +192,48 @@ def get_external_ip_from_default_teacher(network: str,
 
 def get_external_ip_from_known_nodes(known_nodes: FleetSensor,
                                      sample_size: int = 3,
+                                     timeout: float = 10,
                                      log: Logger = IP_DETECTION_LOGGER
                                      ) -> Union[str, None]:
     """
     Randomly select a sample of peers to determine the external IP address
-    of this host. The first node to reply successfully will be used.
-    # TODO: Parallelize the requests and compare results.
+    of this host. The sampled nodes are queried concurrently and
+    the first node to reply successfully will be used.
+    # TODO: Compare results.
     """
     if len(known_nodes) < sample_size:
         return  # There are too few known nodes
     sample = random.sample(list(known_nodes), sample_size)
-    client = NucypherMiddlewareClient()
-    for node in sample:
-        ip = _request_from_node(teacher=node, client=client)
-        if ip:
-            log.info(f'Fetched external IP address ({ip}) from randomly selected known nodes.')
-            return ip
+
+    def worker(node) -> str:
+        # Each sampled node is asked once, so there is no connection to share between them
+        ip = _request_from_node(teacher=node)
+        if not ip:
+            raise UnknownIPAddress(f'{node} did not report an external IP address')
+        return ip
+
+    def value_factory(successes: int) -> Optional[List]:
+        # The whole sample is dispatched in a single batch
+        batch = list(sample)
+        sample.clear()
+        return batch or None
+
+    worker_pool = WorkerPool(worker=worker,
+                             value_factory=value_factory,
+                             target_successes=1,
+                             timeout=timeout)
+    worker_pool.start()
+    try:
+        successes = worker_pool.block_until_target_successes()
+    except (WorkerPool.OutOfValues, WorkerPool.TimedOut):
+        return  # None of the sampled nodes replied
+    finally:
+        worker_pool.cancel()
+        # don't wait for the slower nodes by "joining" - the first reply is all we need
+
+    ip = next(iter(successes.values()))
+    log.info(f'Fetched external IP address ({ip}) from randomly selected known nodes.')
+    return ip
 
 
 def get_external_ip_from_centralized_source(log: Logger = IP_DETECTION_LOGGER) -> Union[str, None]:
@@ -16,7 +16,7 @@
 """
 
 import random
-from typing import List
+from typing import Dict
 
 import pytest
 
@@ -30,7 +30,6 @@ try:
     # include dependencies that have sub-dependencies on prometheus
     from nucypher.utilities.prometheus.collector import (
         BlockchainMetricsCollector,
-        MetricsCollector,
         OperatorMetricsCollector,
         StakingProviderMetricsCollector,
         UrsulaInfoMetricsCollector,
@@ -42,73 +41,98 @@ try:
 except ImportError:
     PROMETHEUS_INSTALLED = False
 
+pytestmark = pytest.mark.skipif(condition=(not PROMETHEUS_INSTALLED), reason="prometheus_client is required for test")
 
-@pytest.mark.skipif(condition=(not PROMETHEUS_INSTALLED), reason="prometheus_client is required for test")
-def test_ursula_info_metrics_collector(test_registry,
-                                       blockchain_ursulas,
-                                       agency):
-    ursula = random.choice(blockchain_ursulas)
-    collector = UrsulaInfoMetricsCollector(ursula=ursula)
+METRICS_PREFIX = 'test_metrics_collectors'
+
+
+@pytest.fixture(scope="module")
+def sample_ursula(blockchain_ursulas):
+    """The same ursula is used by all tests in this module."""
+    return random.choice(blockchain_ursulas)
+
+
+@pytest.fixture(scope="module")
+def prom_registry_and_collectors(test_registry, agency, sample_ursula, staking_providers):
+    """A single registry shared by the collector tests, with each collector type initialized once."""
+    ursula = sample_ursula
+    collectors = {
+        "ursula_info": UrsulaInfoMetricsCollector(ursula=ursula),
+        "blockchain": BlockchainMetricsCollector(eth_provider_uri=TEST_ETH_PROVIDER_URI),
+        "staking_provider": StakingProviderMetricsCollector(
+            staking_provider_address=random.choice(staking_providers),
+            contract_registry=test_registry,
+        ),
+        "operator": OperatorMetricsCollector(
+            domain=ursula.domain,
+            operator_address=ursula.operator_address,
+            contract_registry=test_registry,
+        ),
+    }
 
     collector_registry = CollectorRegistry()
-    prefix = 'test_ursula_info_metrics_collector'
-    collector.initialize(metrics_prefix=prefix, registry=collector_registry)
+    for collector in collectors.values():
+        collector.initialize(metrics_prefix=METRICS_PREFIX, registry=collector_registry)
+
+    yield collector_registry, collectors
+
+
+def test_ursula_info_metrics_collector(sample_ursula, prom_registry_and_collectors):
+    collector_registry, collectors = prom_registry_and_collectors
+    collector = collectors["ursula_info"]
+    ursula = sample_ursula
+    prefix = METRICS_PREFIX
+
     collector.collect()
+    samples = _snapshot(collector_registry)
 
     mode = "running" if ursula._learning_task.running else "stopped"
-    learning_mode = collector_registry.get_sample_value(
-        f"{prefix}_node_discovery", labels={f"{prefix}_node_discovery": f"{mode}"}
-    )
+    learning_mode = samples[(f"{prefix}_node_discovery", mode)]
     assert learning_mode == 1
 
-    known_nodes = collector_registry.get_sample_value(f"{prefix}_known_nodes")
+    known_nodes = samples[f"{prefix}_known_nodes"]
     assert known_nodes == len(ursula.known_nodes)
 
-    reencryption_requests = collector_registry.get_sample_value(
-        f"{prefix}_reencryption_requests"
-    )
+    reencryption_requests = samples[f"{prefix}_reencryption_requests"]
     assert reencryption_requests == 0
 
 
-@pytest.mark.skipif(condition=(not PROMETHEUS_INSTALLED), reason="prometheus_client is required for test")
-def test_blockchain_metrics_collector(testerchain):
-    collector = BlockchainMetricsCollector(eth_provider_uri=TEST_ETH_PROVIDER_URI)
+def test_blockchain_metrics_collector(testerchain, prom_registry_and_collectors):
+    collector_registry, collectors = prom_registry_and_collectors
+    collector = collectors["blockchain"]
+    chain_id_metric = f"{METRICS_PREFIX}_eth_chain_id"
+    block_number_metric = f"{METRICS_PREFIX}_eth_block_number"
+
+    # read expectations before collecting; new blocks may be mined in the meantime
+    expected_chain_id = testerchain.client.chain_id
+    expected_block_number = testerchain.get_block_number()
 
-    collector_registry = CollectorRegistry()
-    prefix = 'test_blockchain_metrics_collector'
-    collector.initialize(metrics_prefix=prefix, registry=collector_registry)
     collector.collect()
+    samples = _snapshot(collector_registry)
 
-    metric_name = f"{prefix}_eth_chain_id"
-    assert metric_name in collector_registry._names_to_collectors.keys()
-    chain_id = collector_registry.get_sample_value(f"{prefix}_eth_chain_id")
-    assert chain_id == testerchain.client.chain_id
+    assert chain_id_metric in collector_registry._names_to_collectors
+    chain_id = samples[chain_id_metric]
+    assert chain_id == expected_chain_id
 
-    metric_name = f"{prefix}_eth_block_number"
-    assert metric_name in collector_registry._names_to_collectors.keys()
-    block_number = collector_registry.get_sample_value(metric_name)
-    assert block_number == testerchain.get_block_number()
+    assert block_number_metric in collector_registry._names_to_collectors
+    block_number = samples[block_number_metric]
+    assert block_number >= expected_block_number
 
 
-@pytest.mark.skipif(condition=(not PROMETHEUS_INSTALLED), reason="prometheus_client is required for test")
-def test_staking_provider_metrics_collector(test_registry, staking_providers):
-    staking_provider_address = random.choice(staking_providers)
-    collector = StakingProviderMetricsCollector(
-        staking_provider_address=staking_provider_address,
-        contract_registry=test_registry,
-    )
-    collector_registry = CollectorRegistry()
-    prefix = "test_staking_provider_metrics_collector"
-    collector.initialize(metrics_prefix=prefix, registry=collector_registry)
+def test_staking_provider_metrics_collector(test_registry, prom_registry_and_collectors):
+    collector_registry, collectors = prom_registry_and_collectors
+    collector = collectors["staking_provider"]
+    staking_provider_address = collector.staking_provider_address
+    prefix = METRICS_PREFIX
+
     collector.collect()
+    samples = _snapshot(collector_registry)
 
     pre_application_agent = ContractAgency.get_agent(
         PREApplicationAgent, registry=test_registry
     )
 
-    active_stake = collector_registry.get_sample_value(
-        f"{prefix}_associated_active_stake"
-    )
+    active_stake = samples[f"{prefix}_associated_active_stake"]
     # only floats can be stored
     assert active_stake == float(
         int(
@@ -122,53 +146,47 @@ def test_staking_provider_metrics_collector(test_registry, staking_providers):
         staking_provider=staking_provider_address
     )
 
-    operator_confirmed = collector_registry.get_sample_value(
-        f"{prefix}_operator_confirmed"
-    )
+    operator_confirmed = samples[f"{prefix}_operator_confirmed"]
     assert operator_confirmed == staking_provider_info.operator_confirmed
 
-    operator_start = collector_registry.get_sample_value(
-        f"{prefix}_operator_start_timestamp"
-    )
+    operator_start = samples[f"{prefix}_operator_start_timestamp"]
     assert operator_start == staking_provider_info.operator_start_timestamp
 
 
-@pytest.mark.skipif(condition=(not PROMETHEUS_INSTALLED), reason="prometheus_client is required for test")
-def test_operator_metrics_collector(test_registry, blockchain_ursulas):
-    ursula = random.choice(blockchain_ursulas)
-    collector = OperatorMetricsCollector(
-        domain=ursula.domain,
-        operator_address=ursula.operator_address,
-        contract_registry=test_registry,
-    )
-    collector_registry = CollectorRegistry()
-    prefix = 'test_worker_metrics_collector'
-    collector.initialize(metrics_prefix=prefix, registry=collector_registry)
+def test_operator_metrics_collector(sample_ursula, prom_registry_and_collectors):
+    collector_registry, collectors = prom_registry_and_collectors
+    collector = collectors["operator"]
+    ursula = sample_ursula
+    prefix = METRICS_PREFIX
+
     collector.collect()
+    samples = _snapshot(collector_registry)
 
-    operator_eth = collector_registry.get_sample_value(f"{prefix}_operator_eth_balance")
+    operator_eth = samples[f"{prefix}_operator_eth_balance"]
     # only floats can be stored
     assert operator_eth == float(ursula.eth_balance)
 
 
-@pytest.mark.skipif(condition=(not PROMETHEUS_INSTALLED), reason="prometheus_client is required for test")
-def test_all_metrics_collectors_sanity_collect(blockchain_ursulas):
-    ursula = random.choice(blockchain_ursulas)
+def test_all_metrics_collectors_sanity_collect(sample_ursula):
+    ursula = sample_ursula
 
     collector_registry = CollectorRegistry()
     prefix = 'test_all_metrics_collectors'
 
-    metrics_collectors = create_metrics_collectors(ursula=ursula)
-    initialize_collectors(metrics_collectors=metrics_collectors,
-                          collector_registry=collector_registry,
-                          prefix=prefix)
-
+    metrics_collectors = tuple(create_metrics_collectors(ursula=ursula))
     for collector in metrics_collectors:
+        collector.initialize(metrics_prefix=prefix, registry=collector_registry)
         collector.collect()
 
 
-def initialize_collectors(metrics_collectors: List['MetricsCollector'],
-                          collector_registry: 'CollectorRegistry',
-                          prefix: str) -> None:
-    for collector in metrics_collectors:
-        collector.initialize(metrics_prefix=prefix, registry=collector_registry)
+def _snapshot(collector_registry: 'CollectorRegistry') -> Dict:
+    """
+    Collects all the metrics of the registry in a single pass.
+    Sample values are keyed by sample name, or by a (sample name, *label values) tuple for labelled samples.
+    """
+    samples = dict()
+    for metric in collector_registry.collect():
+        for sample in metric.samples:
+            key = (sample.name, *sample.labels.values()) if sample.labels else sample.name
+            samples[key] = sample.value
+    return samples
@@ -89,6 +89,13 @@ def test_date_time():
     assert deserialized_new_time != now
     assert deserialized_new_time == new_time
 
+    # other ISO 8601 forms are parsed the same way as maya does
+    for value in ("2022-01-01T12:00:00",         # naive, assumed to be UTC
+                  "2022-01-01T12:00:00+05:00",   # explicit offset
+                  "2022-032T12:00:00Z"):         # ordinal date, only understood by maya
+        deserialized = field._deserialize(value=value, attr=None, data=None)
+        assert deserialized == maya.MayaDT.from_iso8601(iso8601_string=value)
+
     # invalid date
     with pytest.raises(InvalidInputData):
         field._deserialize(value="test", attr=None, data=None)
@@ -15,6 +15,8 @@
  along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
 from pathlib import Path
+from queue import Queue
+from threading import Event
 
 import pytest
 from eth_utils import to_checksum_address
@@ -28,13 +30,17 @@ from nucypher.network.exceptions import NodeSeemsToBeDown
 from nucypher.network.middleware import NucypherMiddlewareClient
 from nucypher.network.nodes import TEACHER_NODES
 from nucypher.network.protocols import InterfaceInfo
+from nucypher.utilities.concurrency import WorkerPool
 from nucypher.utilities.networking import (
     determine_external_ip_address,
     get_external_ip_from_centralized_source,
     get_external_ip_from_default_teacher,
     get_external_ip_from_known_nodes,
     CENTRALIZED_IP_ORACLE_URL,
-    UnknownIPAddress
+    MAX_IP_RESPONSE_LENGTH,
+    UnknownIPAddress,
+    _DEFAULT_TEACHER_CACHE,
+    _request
 )
 from tests.constants import MOCK_IP_ADDRESS
 
@@ -54,6 +60,10 @@ class Dummy:  # Teacher
         status_code = 200
         text = MOCK_IP_ADDRESS
 
+    class InvalidResponse:
+        status_code = 200
+        text = 'not an IP address'
+
     class BadResponse:
         status_code = 404
         text = None
@@ -110,6 +120,23 @@ def mock_client(mocker):
 def mock_default_teachers(mocker):
     teachers = {MOCK_NETWORK: (f"{MOCK_IP_ADDRESS}:{MOCK_PORT}", )}
     mocker.patch.dict(TEACHER_NODES, teachers, clear=True)
+    mocker.patch.dict(_DEFAULT_TEACHER_CACHE, clear=True)
+
+
+@pytest.fixture(autouse=True)
+def worker_pools(mocker):
+    """joins the worker pools left running in the background, so their requests can't outlive the test"""
+    pools = []
+    start = WorkerPool.start
+
+    def tracked_start(worker_pool):
+        pools.append(worker_pool)
+        start(worker_pool)
+
+    mocker.patch.object(WorkerPool, 'start', tracked_start)
+    yield pools
+    for pool in pools:
+        pool.join()
 
 
 def test_get_external_ip_from_centralized_source(mock_requests):
@@ -117,6 +144,25 @@ def test_get_external_ip_from_centralized_source(mock_requests):
     mock_requests.assert_called_once_with(url=CENTRALIZED_IP_ORACLE_URL)
 
 
+def test_request_only_returns_ip_addresses(mocker):
+    response = mocker.MagicMock(status_code=200)
+    mocker.patch('nucypher.utilities.networking.requests.get', return_value=response)
+
+    response.raw.read.return_value = f'{MOCK_IP_ADDRESS}\n'.encode()
+    assert _request(url=CENTRALIZED_IP_ORACLE_URL) == MOCK_IP_ADDRESS
+
+    # Only a bounded prefix of the response body is read
+    read_size = response.raw.read.call_args[0][0]
+    assert len(MOCK_IP_ADDRESS) < read_size <= MAX_IP_RESPONSE_LENGTH
+
+    response.raw.read.return_value = b'<html>Not an IP address</html>'
+    assert _request(url=CENTRALIZED_IP_ORACLE_URL) is None
+
+    response.status_code = 404
+    response.raw.read.return_value = MOCK_IP_ADDRESS.encode()
+    assert _request(url=CENTRALIZED_IP_ORACLE_URL) is None
+
+
 def test_get_external_ip_from_empty_known_nodes(mock_requests):
     sensor = FleetSensor(domain=MOCK_NETWORK)
     assert len(sensor) == 0
@@ -135,7 +181,7 @@ def test_get_external_ip_from_known_nodes_with_one_known_node(mock_requests):
     mock_requests.assert_not_called()
 
 
-def test_get_external_ip_from_known_nodes(mock_client):
+def test_get_external_ip_from_known_nodes(mock_client, worker_pools):
 
     # Setup FleetSensor
     sensor = FleetSensor(domain=MOCK_NETWORK)
@@ -146,18 +192,78 @@ def test_get_external_ip_from_known_nodes(mock_client):
     sensor.record_fleet_state()
     assert len(sensor) == sample_size
 
-    # First sampled node replies
-    get_external_ip_from_known_nodes(known_nodes=sensor, sample_size=sample_size)
-    assert mock_client.call_count == 1
+    # Sampled nodes are queried concurrently; the first reply is used
+    ip = get_external_ip_from_known_nodes(known_nodes=sensor, sample_size=sample_size)
+    assert ip == MOCK_IP_ADDRESS
+    # slower requests are not waited for, so wait for them before changing the mock
+    for pool in worker_pools:
+        pool.join()
+    assert 1 <= mock_client.call_count <= sample_size
     mock_client.call_count = 0  # reset
 
     # All sampled nodes dont respond
     mock_client.return_value = Dummy.BadResponse
-    get_external_ip_from_known_nodes(known_nodes=sensor, sample_size=sample_size)
+    ip = get_external_ip_from_known_nodes(known_nodes=sensor, sample_size=sample_size)
+    assert ip is None
     assert mock_client.call_count == sample_size
 
 
-def test_get_external_ip_from_known_nodes_client(mocker, mock_client):
+def test_get_external_ip_from_known_nodes_does_not_wait_for_slow_nodes(mock_client):
+    sensor = FleetSensor(domain=MOCK_NETWORK)
+    sample_size = 3
+    sensor.record_node(Dummy(b'deadbeefdeadbeefdead'))
+    sensor.record_node(Dummy(b'deadllamadeadllamade'))
+    sensor.record_node(Dummy(b'deadmousedeadmousede'))
+    sensor.record_fleet_state()
+
+    # Only the last node to be queried replies, the others hang until released;
+    # querying the nodes one by one would never reach it.
+    release = Event()
+    calls = Queue()
+    for _ in range(sample_size - 1):
+        calls.put(False)
+    calls.put(True)
+
+    def invoke_method(*args, **kwargs):
+        if calls.get_nowait():
+            return Dummy.GoodResponse
+        release.wait(timeout=10)
+        return Dummy.BadResponse
+
+    mock_client.side_effect = invoke_method
+    try:
+        ip = get_external_ip_from_known_nodes(known_nodes=sensor, sample_size=sample_size)
+        assert ip == MOCK_IP_ADDRESS
+        assert not release.is_set()
+        assert mock_client.call_count == sample_size
+    finally:
+        release.set()
+
+
+def test_get_external_ip_from_known_nodes_timeout(mock_client):
+    sensor = FleetSensor(domain=MOCK_NETWORK)
+    sample_size = 3
+    sensor.record_node(Dummy(b'deadbeefdeadbeefdead'))
+    sensor.record_node(Dummy(b'deadllamadeadllamade'))
+    sensor.record_node(Dummy(b'deadmousedeadmousede'))
+    sensor.record_fleet_state()
+
+    # None of the sampled nodes reply in time
+    release = Event()
+
+    def invoke_method(*args, **kwargs):
+        release.wait(timeout=10)
+        return Dummy.GoodResponse
+
+    mock_client.side_effect = invoke_method
+    try:
+        ip = get_external_ip_from_known_nodes(known_nodes=sensor, sample_size=sample_size, timeout=0.5)
+        assert ip is None
+    finally:
+        release.set()
+
+
+def test_get_external_ip_from_known_nodes_client(mocker, mock_client, worker_pools):
 
     # Setup FleetSensor
     sensor = FleetSensor(domain=MOCK_NETWORK)
@@ -173,7 +279,9 @@ def test_get_external_ip_from_known_nodes_client(mocker, mock_client):
     teacher_uri = TEACHER_NODES[MOCK_NETWORK][0]
 
     get_external_ip_from_known_nodes(known_nodes=sensor, sample_size=sample_size)
-    assert mock_client.call_count == 1  # first node responded
+    for pool in worker_pools:
+        pool.join()
+    assert 1 <= mock_client.call_count <= sample_size  # nodes are queried concurrently
 
     function, endpoint = mock_client.call_args[0]
     assert function.__name__ == 'get'
@@ -206,6 +314,31 @@ def test_get_external_ip_from_default_teacher(mocker, mock_client, mock_requests
     assert endpoint == f'https://{teacher_uri}/ping'
 
 
+def test_get_external_ip_from_default_teacher_is_cached(mocker, mock_client):
+    from_teacher_uri = mocker.patch.object(Ursula, 'from_teacher_uri', return_value=Dummy(b'deadbeefdeadbeefdead'))
+
+    # Failed requests do not cache the teacher
+    mock_client.return_value = Dummy.BadResponse
+    assert get_external_ip_from_default_teacher(network=MOCK_NETWORK) is None
+    assert get_external_ip_from_default_teacher(network=MOCK_NETWORK) is None
+    assert from_teacher_uri.call_count == 2
+
+    # Once the teacher replies, it is reused
+    mock_client.return_value = Dummy.GoodResponse
+    assert get_external_ip_from_default_teacher(network=MOCK_NETWORK) == MOCK_IP_ADDRESS
+    assert get_external_ip_from_default_teacher(network=MOCK_NETWORK) == MOCK_IP_ADDRESS
+    assert from_teacher_uri.call_count == 3
+    assert mock_client.call_count == 4
+
+    # A cached teacher that errors is evicted as well
+    mock_client.return_value = Dummy.InvalidResponse
+    with pytest.raises(UnknownIPAddress):
+        get_external_ip_from_default_teacher(network=MOCK_NETWORK)
+    mock_client.return_value = Dummy.GoodResponse
+    assert get_external_ip_from_default_teacher(network=MOCK_NETWORK) == MOCK_IP_ADDRESS
+    assert from_teacher_uri.call_count == 4
+
+
 def test_get_external_ip_default_unknown_network():
     unknown_domain = 'thisisnotarealdomain'
 
@@ -0,0 +1,58 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from nucypher.blockchain.eth.agents import StakingProvidersReservoir
+from nucypher.policy.reservoir import MergedReservoir, PrefetchStrategy
+
+
+def test_merged_reservoir_draws_included_values_first():
+    included = ['included_1', 'included_2']
+    sampled = {'sampled_1': 1, 'sampled_2': 1, 'sampled_3': 1}
+    reservoir = MergedReservoir(included, StakingProvidersReservoir(sampled))
+
+    assert reservoir() == 'included_1'
+    batch = reservoir.draw_at_most(3)
+    assert batch[0] == 'included_2'
+    assert set(batch[1:]) <= set(sampled)
+
+    # Only one value left
+    last = reservoir.draw_at_most(10)
+    assert len(last) == 1
+    assert set(batch[1:] + last) == set(sampled)
+
+    assert reservoir.draw_at_most(1) == []
+    assert reservoir() is None
+
+
+def test_prefetch_strategy_batches():
+    sampled = {f'sampled_{i}': 1 for i in range(5)}
+    reservoir = MergedReservoir(['included'], StakingProvidersReservoir(sampled))
+    value_factory = PrefetchStrategy(reservoir, need_successes=4)
+
+    batch = value_factory(0)
+    assert len(batch) == 4
+    assert batch[0] == 'included'
+
+    # Enough successes already
+    assert value_factory(4) is None
+
+    # Only the remaining values are returned
+    batch = value_factory(1)
+    assert len(batch) == 2
+
+    # Out of values
+    assert value_factory(0) is None
@@ -0,0 +1,36 @@
+"""
+ This file is part of nucypher.
+
+ nucypher is free software: you can redistribute it and/or modify
+ it under the terms of the GNU Affero General Public License as published by
+ the Free Software Foundation, either version 3 of the License, or
+ (at your option) any later version.
+
+ nucypher is distributed in the hope that it will be useful,
+ but WITHOUT ANY WARRANTY; without even the implied warranty of
+ MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ GNU Affero General Public License for more details.
+
+ You should have received a copy of the GNU Affero General Public License
+ along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from nucypher.network.middleware import NucypherMiddlewareClient
+
+
+def test_middleware_client_uses_pooled_session():
+    client = NucypherMiddlewareClient()
+    session = client.library
+    assert isinstance(session, requests.Session)
+
+    adapter = session.get_adapter('https://127.0.0.1:9151/ping')
+    assert isinstance(adapter, HTTPAdapter)
+    assert adapter is session.adapters['https://']
+    assert adapter.max_retries.total == 0
+    assert adapter._pool_connections == NucypherMiddlewareClient.pool_connections
+    assert adapter._pool_maxsize == NucypherMiddlewareClient.pool_maxsize
+    session.close()